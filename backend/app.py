@@ -9,6 +9,9 @@ API available at: http://localhost:5000
 
 from flask import Flask, jsonify, request, send_from_directory
 from flask_cors import CORS
+from flask_compress import Compress
+from waitress import serve
+import orjson
 import time
 import os
 import logging
@@ -16,25 +19,16 @@ from logging.handlers import RotatingFileHandler
 
 # Import our modules
 from metrics import (
-    get_cpu_usage,
-    get_cpu_frequency,
-    get_memory_info,
+    DEFAULT_POLL_INTERVAL,
+    MAX_PROCESSES,
+    MetricsCollector,
     get_disk_info,
     get_disk_device,
-    get_network_rates,
     get_network_interfaces,
     get_primary_interface,
-    get_uptime,
-    get_top_processes,
-    get_load_average,
-    add_to_history,
     get_history,
 )
 from rpi_sensors import (
-    get_cpu_temperature,
-    get_fan_speed,
-    get_power_draw,
-    get_throttle_status,
     get_system_info,
     is_raspberry_pi,
 )
@@ -42,104 +36,142 @@ from rpi_sensors import (
 app = Flask(__name__, static_folder='../build', static_url_path='')
 CORS(app)  # Enable CORS for React frontend
 
+# gzip/br compress JSON responses; tiny ones like /api/health aren't worth it
+app.config['COMPRESS_MIN_SIZE'] = 200
+Compress(app)
+
+# flask-compress rewrites the ETag of a compressed response to "<tag>:<algorithm>",
+# and that is what clients send back in If-None-Match
+_COMPRESSED_ETAG_SUFFIXES = tuple(':' + algorithm for algorithm in app.config['COMPRESS_ALGORITHM'])
+
 # Configuration
 API_VERSION = '1.0.0'
-DEFAULT_POLL_INTERVAL = 2  # seconds
+METRICS_CACHE_CONTROL = 'max-age=1, stale-while-revalidate=2'
+SERVER_THREADS = 4  # waitress worker threads
 BUILD_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'build')
 
+# Collector ticks restart at 1 with the process; prefixing them with the start
+# time keeps a tag cached before a restart from matching a different payload
+_ETAG_EPOCH = format(time.time_ns(), 'x')
+
+# Background metrics collection; /api/metrics, /api/processes and
+# /api/thermal serve its latest snapshot so request threads never touch
+# psutil or the sensors
+collector = MetricsCollector(interval=DEFAULT_POLL_INTERVAL)
+collector.start()
+
+
+def json_response(body):
+    """Wrap already-encoded JSON bytes in a response"""
+    return app.response_class(body, mimetype='application/json')
+
+
+def ojsonify(obj):
+    """Like jsonify, but encoded with orjson (much faster for metric payloads)"""
+    return json_response(orjson.dumps(obj))
+
+
+def _build_system_info():
+    """Build the /api/system payload (static for the lifetime of the process)"""
+    info = dict(get_system_info())
+    info['is_raspberry_pi'] = is_raspberry_pi()
+    uname = os.uname()
+    info['hostname'] = uname.nodename
+    info['kernel'] = uname.release
+    return info
+
+
+# Static responses, encoded once at startup
+_SYSTEM_INFO_BYTES = orjson.dumps(_build_system_info())
+_HEALTH_STATIC = {
+    'status': 'ok',
+    'service': 'rpi5-monitor-api',
+    'version': API_VERSION,
+}
+
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'ok',
-        'service': 'rpi5-monitor-api',
-        'version': API_VERSION,
-        'timestamp': time.time(),
-    })
+    return ojsonify({**_HEALTH_STATIC, 'timestamp': time.time()})
 
 
 @app.route('/api/system', methods=['GET'])
 def get_system():
     """Get static system information"""
-    info = get_system_info()
-    info['is_raspberry_pi'] = is_raspberry_pi()
-    info['hostname'] = os.uname().nodename
-    info['kernel'] = os.uname().release
-    return jsonify(info)
+    return json_response(_SYSTEM_INFO_BYTES)
+
+
+def _etag_matches(etag):
+    """
+    Check the request's If-None-Match against etag (weak comparison)
+    Also matches the tag with any compression suffix added by flask-compress
+    """
+    if_none_match = request.if_none_match
+    return any(if_none_match.contains_weak(candidate)
+               for candidate in (etag, *(etag + suffix for suffix in _COMPRESSED_ETAG_SUFFIXES)))
+
+
+def _cached_json_response(payload):
+    """
+    Serve (tick, bytes) pre-encoded by the collector, or 503 before its first sample
+    The tick (per process start) is a weak ETag, so polls that find no new
+    sample get an empty 304
+    """
+    tick, body = payload
+    if body is None:
+        return jsonify({'error': 'Metrics not collected yet'}), 503
+
+    etag = f"{_ETAG_EPOCH}-{tick}"
+    if _etag_matches(etag):
+        response = app.response_class(status=304)
+    else:
+        response = json_response(body)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = METRICS_CACHE_CONTROL
+    return response
 
 
 @app.route('/api/metrics', methods=['GET'])
 def get_metrics():
     """
-    Get current system metrics
-    This is the main endpoint called by the frontend
+    Get current system metrics (static and live fields combined)
+    Served from the background collector, no sampling happens here
     """
     try:
-        # Collect all metrics
-        cpu_usage = get_cpu_usage()
-        cpu_temp = get_cpu_temperature()
-        cpu_freq = get_cpu_frequency()
-        memory = get_memory_info()
-        disk = get_disk_info('/')
-        network = get_network_rates()
-        uptime = get_uptime()
-        fan_speed = get_fan_speed()
-        power_draw = get_power_draw()
-        load = get_load_average()
-
-        # Build response matching frontend expectations
-        metrics = {
-            # CPU metrics
-            'cpuUsage': cpu_usage,
-            'cpuTemp': cpu_temp if cpu_temp is not None else 0,
-            'cpuFreq': cpu_freq,
-
-            # Memory metrics
-            'memoryUsage': memory['usage_percent'],
-            'memoryTotal': memory['total_gb'],
-            'memoryUsedGb': memory['used_gb'],
-            'memoryAvailableGb': memory['available_gb'],
-
-            # Disk metrics
-            'diskUsed': disk['usage_percent'] if disk else 0,
-            'diskTotal': disk['total_gb'] if disk else 0,
-            'diskUsedGb': disk['used_gb'] if disk else 0,
-            'diskFreeGb': disk['free_gb'] if disk else 0,
-            'diskDevice': get_disk_device(),
-
-            # Network metrics (MB/s for display)
-            'networkUp': network['upload_mbps'],
-            'networkDown': network['download_mbps'],
-
-            # Network metrics (KB/s for charts)
-            'networkInKbps': network['download_kbps'],
-            'networkOutKbps': network['upload_kbps'],
-
-            # System info
-            'uptime': uptime,
-            'fanSpeed': fan_speed if fan_speed is not None else 0,
-            'powerDraw': power_draw if power_draw is not None else 0,
-
-            # Additional info
-            'networkInterface': get_primary_interface(),
-            'loadAverage': load,
-            'timestamp': time.time(),
-        }
-
-        # Add to history for charts
-        add_to_history({
-            'cpu_usage': cpu_usage,
-            'cpu_temp': cpu_temp if cpu_temp is not None else 0,
-            'memory_usage': memory['usage_percent'],
-            'network_in_kbps': network['download_kbps'],
-            'network_out_kbps': network['upload_kbps'],
-        })
+        return _cached_json_response(collector.snapshot_json())
+
+    except Exception as e:
+        app.logger.error(f"Error reading metrics: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/api/metrics/live', methods=['GET'])
+def get_metrics_live():
+    """
+    Get the frequently changing metrics only
+    This is the main endpoint polled by the frontend
+    """
+    try:
+        return _cached_json_response(collector.live_json())
+
+    except Exception as e:
+        app.logger.error(f"Error reading metrics: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
 
-        return jsonify(metrics)
+
+@app.route('/api/metrics/static', methods=['GET'])
+def get_metrics_static():
+    """
+    Get the rarely changing metrics: memory/disk totals, disk device,
+    network interface, hostname and kernel
+    Fetched once by the frontend (and refreshed occasionally)
+    """
+    try:
+        return _cached_json_response(collector.static_json())
 
     except Exception as e:
-        app.logger.error(f"Error collecting metrics: {e}", exc_info=True)
+        app.logger.error(f"Error reading metrics: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
 
@@ -147,11 +179,22 @@ def get_metrics():
 def get_metrics_history():
     """
     Get historical metrics for charts
-    Returns array of data points with time, cpu, temp, mem, netIn, netOut
+    Returns one list per field: timestamp, cpu, temp, mem, netIn, netOut
+    Optional query param: since (epoch seconds, only newer samples are returned)
+    Supports If-None-Match, answering 304 when no sample was added
     """
     try:
-        history = get_history()
-        return jsonify(history)
+        since = request.args.get('since', type=float)
+        history = get_history(since)
+
+        timestamps = history['timestamp']
+        etag = f"{len(timestamps)}-{timestamps[-1] if timestamps else 0}"
+        if _etag_matches(etag):
+            response = app.response_class(status=304)
+        else:
+            response = ojsonify(history)
+        response.set_etag(etag)
+        return response
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -161,12 +204,13 @@ def get_processes():
     """
     Get top processes sorted by CPU usage
     Optional query param: limit (default 10)
+    Served from the background collector, no sampling happens here
     """
     try:
         limit = request.args.get('limit', 10, type=int)
-        limit = min(max(limit, 1), 50)  # Clamp between 1 and 50
+        limit = min(max(limit, 1), MAX_PROCESSES)  # Clamp between 1 and 50
 
-        processes = get_top_processes(limit)
+        processes = collector.top_processes(limit)
 
         # Format for frontend
         formatted = []
@@ -180,7 +224,7 @@ def get_processes():
                 'mem_raw': proc['mem_mb'],
             })
 
-        return jsonify(formatted)
+        return ojsonify(formatted)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -201,15 +245,12 @@ def get_network():
 
 @app.route('/api/thermal', methods=['GET'])
 def get_thermal():
-    """Get thermal and power information"""
+    """
+    Get thermal and power information
+    Served from the background collector, no sensor reads happen here
+    """
     try:
-        data = {
-            'cpu_temp': get_cpu_temperature(),
-            'fan_speed': get_fan_speed(),
-            'power_draw': get_power_draw(),
-            'throttle_status': get_throttle_status(),
-        }
-        return jsonify(data)
+        return ojsonify(collector.sensors())
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -319,7 +360,9 @@ def print_startup_info():
     print("\nAPI Endpoints:")
     print("  GET /api/health          - Health check")
     print("  GET /api/system          - System information")
-    print("  GET /api/metrics         - Current metrics (main endpoint)")
+    print("  GET /api/metrics         - Current metrics (all fields)")
+    print("  GET /api/metrics/live    - Frequently changing metrics (main endpoint)")
+    print("  GET /api/metrics/static  - Rarely changing metrics")
     print("  GET /api/metrics/history - Historical data for charts")
     print("  GET /api/processes       - Top processes")
     print("  GET /api/network         - Network interfaces")
@@ -343,9 +386,10 @@ if __name__ == '__main__':
     print_startup_info()
     setup_logging()
 
-    app.run(
+    # Production WSGI server: no reloader/debugger, fixed-size thread pool
+    serve(
+        app,
         host='0.0.0.0',
         port=5000,
-        debug=True,
-        threaded=True,
+        threads=SERVER_THREADS,
     )
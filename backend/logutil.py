@@ -0,0 +1,28 @@
+"""
+Logging helpers for code that runs on every poll
+"""
+import time
+
+RATE_LIMIT_SECONDS = 60
+
+# (logger name, message template) -> time.monotonic() of the last emit
+_last_warn = {}
+
+
+def log_rate_limited(logger, level, message, *args):
+    """
+    Log %-style message at level, dropping repeats of the same message
+    template within RATE_LIMIT_SECONDS
+    Nothing is formatted when the level is disabled or the message is dropped
+    """
+    if not logger.isEnabledFor(level):
+        return
+
+    key = (logger.name, message)
+    now = time.monotonic()
+    last = _last_warn.get(key)
+    if last is not None and now - last < RATE_LIMIT_SECONDS:
+        return
+
+    _last_warn[key] = now
+    logger.log(level, message, *args)
@@ -1,43 +1,208 @@
 """
 System metrics collection using psutil
+On Linux the hot metrics (CPU, memory, network) are parsed from /proc directly
 """
+import bisect
+import functools
+import heapq
+import logging
+import orjson
+import os
 import psutil
+import re
 import time
+from array import array
 from datetime import timedelta
-from collections import deque
-from threading import Lock
+from threading import Event, Lock, RLock, Thread
 
-# Store previous network readings for rate calculation
-_prev_net_io = None
-_prev_net_time = None
-_net_lock = Lock()
+from logutil import log_rate_limited
+from procfs import PseudoFile
+from rpi_sensors import get_all_sensors
 
-# History storage
-_metrics_history = deque(maxlen=60)  # Keep last 60 readings
-_history_lock = Lock()
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2  # seconds
+MAX_PROCESSES = 50  # Largest process list the API hands out
+THROTTLE_POLL_TICKS = 4  # Query vcgencmd (throttle, GPU memory, PMIC) every Nth collector tick
+PROCESS_POLL_TICKS = 2  # Rescan processes every Nth tick (the dashboard polls them every 5 s)
+PROCESS_IDLE_SECONDS = 30  # Stop rescanning when /api/processes wasn't called for this long
+
+# Metrics that only change on reconfiguration; served by /api/metrics/static,
+# everything else by /api/metrics/live
+STATIC_METRIC_KEYS = ('memoryTotal', 'diskTotal', 'diskDevice', 'networkInterface')
+
+# Kept-open /proc files read on every tick
+_PROC_STAT = PseudoFile('/proc/stat')
+_PROC_MEMINFO = PseudoFile('/proc/meminfo')
+_PROC_NET_DEV = PseudoFile('/proc/net/dev', size=16384)
+
+# Matches "Key:   value" lines in /proc/meminfo
+_MEMINFO_RE = re.compile(rb'(\w+):\s+(\d+)')
+
+# Previous network reading (interface, bytes_sent, bytes_recv, time) for rate calculation
+# Swapped as one tuple, so no lock is needed (the collector is the only writer)
+_prev_net_snapshot = None
+
+# Cache for slow-changing values: function name -> (value, expires_at)
+_static_cache = {}
+STATIC_CACHE_TTL = 60  # seconds
+
+# Boot time is constant for the lifetime of the process
+_BOOT_TIME = psutil.boot_time()
+
+# Latest CPU usage (overall and per core), refreshed by the background sampler thread
+_cpu_percent = 0.0
+_cpu_per_core = []
+_cpu_lock = Lock()
+CPU_SAMPLE_INTERVAL = 1.0  # seconds
+
+# History storage (see _HistoryBuffer below)
+HISTORY_SIZE = 60  # Keep last 60 readings
+
+
+def _ttl_cache(func):
+    """Cache a no-argument function's result for STATIC_CACHE_TTL seconds"""
+    @functools.wraps(func)
+    def wrapper():
+        now = time.monotonic()
+        cached = _static_cache.get(func.__name__)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+        value = func()
+        _static_cache[func.__name__] = (value, now + STATIC_CACHE_TTL)
+        return value
+
+    return wrapper
+
+
+def _read_cpu_times():
+    """
+    Read CPU time from /proc/stat: the aggregate line, then one line per core
+    Returns a list of (busy, total) jiffies, counting iowait as idle like psutil
+    """
+    times = []
+    for line in _PROC_STAT.read().split(b'\n'):
+        if not line.startswith(b'cpu'):
+            break  # cpu lines come first, then intr/ctxt/...
+        # user nice system idle iowait irq softirq steal (guest time is already in user/nice)
+        fields = line.split()[1:9]
+        if len(fields) < 8:
+            continue  # Malformed line
+        values = [int(v) for v in fields]
+        total = sum(values)
+        times.append((total - values[3] - values[4], total))
+
+    return times
+
+
+def _busy_percent(prev, current):
+    total_diff = current[1] - prev[1]
+    return (current[0] - prev[0]) / total_diff * 100 if total_diff > 0 else 0.0
+
+
+def _cpu_sampler():
+    """
+    Keep the CPU usage readings (overall and per core) fresh in the background
+    The blocking interval lives here instead of in the request thread
+    """
+    global _cpu_percent, _cpu_per_core
+
+    prev = None  # Previous /proc/stat reading; None until there is a baseline
+    proc_stat_read = False  # /proc/stat has been read successfully at least once
+    use_psutil = False  # No /proc/stat (non-Linux)
+
+    while True:
+        # A failed read must not end the thread (the readings would freeze);
+        # keep the last values, drop the baseline and start over
+        try:
+            if use_psutil:
+                per_core = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL, percpu=True)
+                value = sum(per_core) / len(per_core) if per_core else 0.0
+            else:
+                if prev is not None:
+                    time.sleep(CPU_SAMPLE_INTERVAL)
+                try:
+                    current = _read_cpu_times()
+                except OSError:
+                    if proc_stat_read:
+                        raise
+                    use_psutil = True  # Never readable, e.g. not Linux
+                    continue
+                proc_stat_read = True
+
+                baseline, prev = prev, current
+                if baseline is None:
+                    continue  # Baseline taken, first sample after one interval
+                value, *per_core = [_busy_percent(p, c) for p, c in zip(baseline, current)]
+        except Exception as e:
+            log_rate_limited(logger, logging.WARNING, "Error sampling CPU usage: %s", e)
+            prev = None
+            time.sleep(CPU_SAMPLE_INTERVAL)
+            continue
+
+        with _cpu_lock:
+            _cpu_percent = value
+            _cpu_per_core = per_core
 
 
 def get_cpu_usage():
-    """Get current CPU usage percentage"""
-    return round(psutil.cpu_percent(interval=0.1), 1)
+    """Get current CPU usage percentage (last background sample)"""
+    with _cpu_lock:
+        return _cpu_percent
+
+
+def get_cpu_usage_per_core():
+    """Get current usage percentage of each CPU core (last background sample)"""
+    with _cpu_lock:
+        return list(_cpu_per_core)
 
 
 def get_cpu_frequency():
     """Get current CPU frequency in MHz"""
     freq = psutil.cpu_freq()
     if freq:
-        return round(freq.current, 0)
+        return freq.current
     return None
 
 
+def _read_meminfo():
+    """
+    Read memory figures in bytes from /proc/meminfo
+    Derived the same way as psutil.virtual_memory()
+    """
+    fields = dict(_MEMINFO_RE.findall(_PROC_MEMINFO.read()))
+
+    total = int(fields[b'MemTotal']) * 1024
+    free = int(fields[b'MemFree']) * 1024
+    buffers = int(fields.get(b'Buffers', 0)) * 1024
+    cached = (int(fields.get(b'Cached', 0)) + int(fields.get(b'SReclaimable', 0))) * 1024
+
+    used = total - free - cached - buffers
+    if used < 0:
+        used = total - free
+
+    if b'MemAvailable' in fields:
+        available = int(fields[b'MemAvailable']) * 1024
+    else:
+        available = free + buffers + cached  # Kernels older than 3.14
+
+    return total, used, available
+
+
 def get_memory_info():
     """Get memory usage information"""
-    mem = psutil.virtual_memory()
+    try:
+        total, used, available = _read_meminfo()
+    except (OSError, KeyError, ValueError):
+        mem = psutil.virtual_memory()
+        total, used, available = mem.total, mem.used, mem.available
+
     return {
-        'usage_percent': round(mem.percent, 1),
-        'total_gb': round(mem.total / (1024**3), 2),
-        'used_gb': round(mem.used / (1024**3), 2),
-        'available_gb': round(mem.available / (1024**3), 2),
+        'usage_percent': (total - available) / total * 100,
+        'total_gb': total / (1024**3),
+        'used_gb': used / (1024**3),
+        'available_gb': available / (1024**3),
     }
 
 
@@ -46,16 +211,17 @@ def get_disk_info(path='/'):
     try:
         disk = psutil.disk_usage(path)
         return {
-            'usage_percent': round(disk.percent, 1),
-            'total_gb': round(disk.total / (1024**3), 1),
-            'used_gb': round(disk.used / (1024**3), 1),
-            'free_gb': round(disk.free / (1024**3), 1),
+            'usage_percent': disk.percent,
+            'total_gb': disk.total / (1024**3),
+            'used_gb': disk.used / (1024**3),
+            'free_gb': disk.free / (1024**3),
         }
     except Exception as e:
-        print(f"Error getting disk info: {e}")
+        log_rate_limited(logger, logging.DEBUG, "Error getting disk info: %s", e)
         return None
 
 
+@_ttl_cache
 def get_disk_device():
     """Get the primary disk device name"""
     try:
@@ -68,51 +234,90 @@ def get_disk_device():
         return '/dev/root'
 
 
+def _read_net_bytes(iface):
+    """
+    Read (bytes_sent, bytes_recv) for one interface from /proc/net/dev
+    Returns None if the interface is not listed
+    """
+    try:
+        prefix = iface.encode() + b':'
+        for line in _PROC_NET_DEV.read().splitlines():
+            line = line.lstrip()
+            if line.startswith(prefix):
+                fields = line[len(prefix):].split()
+                return int(fields[8]), int(fields[0])
+        return None
+    except OSError:
+        io = psutil.net_io_counters(pernic=True).get(iface)
+        return (io.bytes_sent, io.bytes_recv) if io else None
+
+
+def _compute_rates(prev_sent, prev_recv, prev_t, cur_sent, cur_recv, cur_t):
+    """
+    Turn two byte-counter readings into rates
+    Returns (mbps_up, mbps_down, kbps_up, kbps_down)
+    """
+    time_diff = cur_t - prev_t
+    if time_diff <= 0:
+        time_diff = 1  # Prevent division by zero
+
+    sent_per_sec = (cur_sent - prev_sent) / time_diff
+    recv_per_sec = (cur_recv - prev_recv) / time_diff
+    return (
+        sent_per_sec / (1024 * 1024),
+        recv_per_sec / (1024 * 1024),
+        sent_per_sec / 1024,
+        recv_per_sec / 1024,
+    )
+
+
+def _zero_rates(bytes_sent, bytes_recv):
+    return {
+        'upload_mbps': 0.0,
+        'download_mbps': 0.0,
+        'upload_kbps': 0.0,
+        'download_kbps': 0.0,
+        'bytes_sent': bytes_sent,
+        'bytes_recv': bytes_recv,
+    }
+
+
 def get_network_rates():
     """
-    Get network upload/download rates in MB/s and KB/s
+    Get network upload/download rates in MB/s and KB/s for the primary interface
     Returns rates calculated from difference since last call
     """
-    global _prev_net_io, _prev_net_time
-
-    with _net_lock:
-        current_io = psutil.net_io_counters()
-        current_time = time.time()
-
-        if _prev_net_io is None or _prev_net_time is None:
-            # First call - store values and return zeros
-            _prev_net_io = current_io
-            _prev_net_time = current_time
-            return {
-                'upload_mbps': 0.0,
-                'download_mbps': 0.0,
-                'upload_kbps': 0.0,
-                'download_kbps': 0.0,
-                'bytes_sent': current_io.bytes_sent,
-                'bytes_recv': current_io.bytes_recv,
-            }
+    global _prev_net_snapshot
 
-        # Calculate time difference
-        time_diff = current_time - _prev_net_time
-        if time_diff <= 0:
-            time_diff = 1  # Prevent division by zero
+    iface = get_primary_interface()
+    counters = _read_net_bytes(iface)
+    if counters is None:
+        # Interface not listed (yet): keep the old baseline, a (0, 0) one would
+        # turn its whole byte count into one huge rate when it shows up
+        return _zero_rates(0, 0)
 
-        # Calculate bytes per second
-        bytes_sent_per_sec = (current_io.bytes_sent - _prev_net_io.bytes_sent) / time_diff
-        bytes_recv_per_sec = (current_io.bytes_recv - _prev_net_io.bytes_recv) / time_diff
+    bytes_sent, bytes_recv = counters
+    current_time = time.time()
 
-        # Update previous values
-        _prev_net_io = current_io
-        _prev_net_time = current_time
+    prev = _prev_net_snapshot
+    _prev_net_snapshot = (iface, bytes_sent, bytes_recv, current_time)
 
-        return {
-            'upload_mbps': round(bytes_sent_per_sec / (1024 * 1024), 2),
-            'download_mbps': round(bytes_recv_per_sec / (1024 * 1024), 2),
-            'upload_kbps': round(bytes_sent_per_sec / 1024, 1),
-            'download_kbps': round(bytes_recv_per_sec / 1024, 1),
-            'bytes_sent': current_io.bytes_sent,
-            'bytes_recv': current_io.bytes_recv,
-        }
+    if prev is None or prev[0] != iface or bytes_sent < prev[1] or bytes_recv < prev[2]:
+        # First call, primary interface changed, or counters reset (e.g. a
+        # driver reload) - this reading is the new baseline, return zeros
+        return _zero_rates(bytes_sent, bytes_recv)
+
+    mbps_up, mbps_down, kbps_up, kbps_down = _compute_rates(
+        prev[1], prev[2], prev[3], bytes_sent, bytes_recv, current_time)
+
+    return {
+        'upload_mbps': mbps_up,
+        'download_mbps': mbps_down,
+        'upload_kbps': kbps_up,
+        'download_kbps': kbps_down,
+        'bytes_sent': bytes_sent,
+        'bytes_recv': bytes_recv,
+    }
 
 
 def get_network_interfaces():
@@ -151,11 +356,12 @@ def get_network_interfaces():
 
             interfaces.append(info)
     except Exception as e:
-        print(f"Error getting network interfaces: {e}")
+        log_rate_limited(logger, logging.DEBUG, "Error getting network interfaces: %s", e)
 
     return interfaces
 
 
+@_ttl_cache
 def get_primary_interface():
     """Get the name of the primary network interface (eth0, wlan0, etc.)"""
     try:
@@ -178,7 +384,7 @@ def get_primary_interface():
 def get_uptime():
     """Get system uptime as formatted string"""
     try:
-        uptime_seconds = time.time() - psutil.boot_time()
+        uptime_seconds = time.time() - _BOOT_TIME
         uptime_delta = timedelta(seconds=uptime_seconds)
 
         days = uptime_delta.days
@@ -198,50 +404,111 @@ def get_uptime():
 def get_top_processes(limit=10):
     """Get top processes sorted by CPU usage"""
     processes = []
+    idle = []  # Only used to fill up the list when few processes are busy
 
     try:
         # Get all processes with their info
-        for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info']):
+        for proc in psutil.process_iter():
             try:
-                pinfo = proc.info
+                # oneshot() reads /proc/<pid>/stat once for all attributes
+                with proc.oneshot():
+                    pinfo = proc.as_dict(attrs=['pid', 'name', 'cpu_percent', 'memory_info'])
                 mem_mb = pinfo['memory_info'].rss / (1024 * 1024) if pinfo['memory_info'] else 0
 
-                processes.append({
+                entry = {
                     'pid': pinfo['pid'],
                     'name': pinfo['name'] or 'Unknown',
-                    'cpu': round(pinfo['cpu_percent'] or 0, 1),
-                    'mem_mb': round(mem_mb, 1),
-                })
+                    'cpu': pinfo['cpu_percent'] or 0,
+                    'mem_mb': mem_mb,
+                }
+                if pinfo['cpu_percent']:
+                    processes.append(entry)
+                elif len(idle) < limit:
+                    idle.append(entry)
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
 
-        # Sort by CPU usage and return top N
-        processes.sort(key=lambda x: x['cpu'], reverse=True)
-        return processes[:limit]
+        # Pick top N by CPU usage without sorting the whole list
+        top = heapq.nlargest(limit, processes, key=lambda x: x['cpu'])
+        return (top + idle)[:limit]
 
     except Exception as e:
-        print(f"Error getting processes: {e}")
+        log_rate_limited(logger, logging.DEBUG, "Error getting processes: %s", e)
         return []
 
 
+class _HistoryBuffer:
+    """
+    Fixed-size ring buffer stored column-wise (one typed array per field)
+    Appending writes into preallocated slots, no per-sample dict is built
+    """
+
+    FIELDS = ('timestamp', 'cpu', 'temp', 'mem', 'netIn', 'netOut')
+
+    def __init__(self, size):
+        self.size = size
+        self.columns = {name: array('d', [0.0]) * size for name in self.FIELDS}
+        self.head = 0  # Next slot to write
+        self.count = 0
+
+    def append(self, values):
+        head = self.head
+        for name, column in self.columns.items():
+            column[head] = values[name]
+        self.head = (head + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def to_dict(self):
+        """Get the buffer as a dict of lists, oldest sample first"""
+        if self.count < self.size:
+            count = self.count
+            return {name: column[:count].tolist() for name, column in self.columns.items()}
+
+        head = self.head
+        return {name: (column[head:] + column[:head]).tolist()
+                for name, column in self.columns.items()}
+
+
+_metrics_history = _HistoryBuffer(HISTORY_SIZE)
+
+# Ordered copy of the buffer, rebuilt by the writer and swapped in whole
+# Readers only ever load this name, so they need no lock
+_history_snapshot = _metrics_history.to_dict()
+
+
 def add_to_history(metrics_snapshot):
-    """Add a metrics snapshot to history"""
-    with _history_lock:
-        _metrics_history.append({
-            'timestamp': time.time(),
-            'time': time.strftime('%H:%M:%S'),
-            'cpu': metrics_snapshot.get('cpu_usage', 0),
-            'temp': metrics_snapshot.get('cpu_temp', 0),
-            'mem': metrics_snapshot.get('memory_usage', 0),
-            'netIn': metrics_snapshot.get('network_in_kbps', 0),
-            'netOut': metrics_snapshot.get('network_out_kbps', 0),
-        })
+    """
+    Add a metrics snapshot to history
+    Single writer only (the metrics collector thread)
+    """
+    global _history_snapshot
+
+    _metrics_history.append({
+        'timestamp': time.time(),
+        'cpu': metrics_snapshot.get('cpu_usage', 0),
+        'temp': metrics_snapshot.get('cpu_temp', 0),
+        'mem': metrics_snapshot.get('memory_usage', 0),
+        'netIn': metrics_snapshot.get('network_in_kbps', 0),
+        'netOut': metrics_snapshot.get('network_out_kbps', 0),
+    })
+    _history_snapshot = _metrics_history.to_dict()
+
+
+def get_history(since=None):
+    """
+    Get metrics history for charts
+    Returns a dict of equal-length lists (timestamp, cpu, temp, mem, netIn,
+    netOut), oldest sample first; clients format timestamp for display
+    If since is given, only samples with a timestamp newer than it are returned
+    """
+    history = _history_snapshot
 
+    if since is not None:
+        start = bisect.bisect_right(history['timestamp'], since)
+        if start:
+            history = {name: values[start:] for name, values in history.items()}
 
-def get_history():
-    """Get metrics history for charts"""
-    with _history_lock:
-        return list(_metrics_history)
+    return history
 
 
 def get_load_average():
@@ -249,9 +516,241 @@ def get_load_average():
     try:
         load1, load5, load15 = psutil.getloadavg()
         return {
-            'load1': round(load1, 2),
-            'load5': round(load5, 2),
-            'load15': round(load15, 2),
+            'load1': load1,
+            'load5': load5,
+            'load15': load15,
         }
     except:
         return None
+
+
+class MetricsCollector:
+    """
+    Collects the /api/metrics payload, the top process list and the
+    Raspberry Pi sensor readings on a background thread
+    Request handlers read the cached snapshot instead of hitting psutil
+    The process list is only rescanned while someone is asking for it
+    """
+
+    def __init__(self, interval=DEFAULT_POLL_INTERVAL):
+        self.interval = interval
+        self.tick = 0  # Incremented on every sample, used as an ETag
+        self._snapshot = {}
+        self._snapshot_json = None
+        self._live_json = None
+        self._static = None
+        self._static_json = None
+        self._static_tick = 0  # Tick at which the static part last changed
+        uname = os.uname()
+        self._host_info = {'hostname': uname.nodename, 'kernel': uname.release}
+        self._processes = []
+        self._processes_time = float('-inf')  # time.monotonic() of the last process scan
+        self._processes_requested = float('-inf')  # ... and of the last top_processes() call
+        self._sensors = {}
+        self._lock = RLock()
+        self._process_scan_lock = Lock()
+        self._wakeup = Event()
+        self._thread = None
+
+    def start(self):
+        """Take a first sample and start the sampling thread (idempotent)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._sample()
+            # Prime per-process cpu_percent so the first real scan has deltas
+            get_top_processes(MAX_PROCESSES)
+            self._thread = Thread(target=self._run, name='metrics-collector', daemon=True)
+            self._thread.start()
+
+    def snapshot(self):
+        """Get the most recent metrics sample"""
+        with self._lock:
+            return dict(self._snapshot)
+
+    def snapshot_json(self):
+        """
+        Get the most recent metrics sample as encoded JSON
+        Returns (tick, bytes); bytes is None before the first sample
+        """
+        with self._lock:
+            return self.tick, self._snapshot_json
+
+    def live_json(self):
+        """Get the frequently changing part of the latest sample as (tick, bytes)"""
+        with self._lock:
+            return self.tick, self._live_json
+
+    def static_json(self):
+        """
+        Get the rarely changing part of the latest sample as (tick, bytes)
+        The tick only moves when one of the static values changes
+        """
+        with self._lock:
+            return self._static_tick, self._static_json
+
+    def top_processes(self, limit=10):
+        """
+        Get the top processes by CPU usage from the most recent scan
+        The first call after an idle spell scans right away (concurrent
+        callers wait for that one scan); the collector then keeps the list
+        fresh for as long as calls keep coming
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._processes_requested = now
+            processes = self._processes
+            stale = now - self._processes_time > PROCESS_IDLE_SECONDS
+
+        if stale:
+            processes = self._scan_processes(max_age=PROCESS_IDLE_SECONDS)
+        return processes[:limit]
+
+    def sensors(self):
+        """Get the most recent temperature, fan, power and throttle readings"""
+        with self._lock:
+            return dict(self._sensors)
+
+    def set_poll_interval(self, seconds):
+        """Change the sampling interval; the next sample is taken right away"""
+        self.interval = seconds
+        self._wakeup.set()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self._sample()
+
+    def _sample(self):
+        try:
+            sensors = self._read_sensors()
+            metrics = self._collect(sensors)
+        except Exception as e:
+            log_rate_limited(logger, logging.WARNING, "Error collecting metrics: %s", e)
+            return
+
+        # Encode once per tick; every request until the next tick reuses the bytes
+        snapshot_json = orjson.dumps(metrics)
+        live_json = orjson.dumps(
+            {key: value for key, value in metrics.items() if key not in STATIC_METRIC_KEYS})
+
+        static = {key: metrics[key] for key in STATIC_METRIC_KEYS}
+        static.update(self._host_info)
+        if static == self._static:
+            static_json = self._static_json
+        else:
+            static_json = orjson.dumps(static)
+
+        with self._lock:
+            self.tick += 1
+            if static_json is not self._static_json:
+                self._static_tick = self.tick
+            self._snapshot = metrics
+            self._snapshot_json = snapshot_json
+            self._live_json = live_json
+            self._static = static
+            self._static_json = static_json
+            self._sensors = sensors
+            scan_processes = (self.tick % PROCESS_POLL_TICKS == 0 and
+                              time.monotonic() - self._processes_requested < PROCESS_IDLE_SECONDS)
+
+        # Walking every PID is the most expensive part of a tick, so at a
+        # slower, steady cadence (per-process cpu_percent deltas stay meaningful)
+        if scan_processes:
+            self._scan_processes(max_age=self.interval)
+
+    def _scan_processes(self, max_age):
+        """
+        Rescan the process list, unless a scan finished less than max_age
+        seconds ago (then return that one): a scan right after another only
+        sees a few ms of cpu_percent delta, which is noise
+        """
+        with self._process_scan_lock:  # Collector and request threads may all get here
+            with self._lock:
+                if time.monotonic() - self._processes_time < max_age:
+                    return self._processes
+
+            processes = get_top_processes(MAX_PROCESSES)
+            with self._lock:
+                self._processes = processes
+                self._processes_time = time.monotonic()
+            return processes
+
+    def _read_sensors(self):
+        # All sysfs / vcgencmd reads in one place, once per tick
+        # Throttle flags are latched by the firmware, so a slower cadence loses nothing
+        poll_vcgencmd = self.tick % THROTTLE_POLL_TICKS == 0 or 'throttle_status' not in self._sensors
+        sensors = get_all_sensors(get_cpu_usage(), vcgencmd=poll_vcgencmd)
+        if not poll_vcgencmd:
+            sensors.update({key: self._sensors[key]
+                            for key in ('throttle_status', 'gpu_memory', 'pmic_adc')})
+
+        return sensors
+
+    def _collect(self, sensors):
+        cpu_usage = get_cpu_usage()
+        cpu_temp = sensors['cpu_temp']
+        cpu_freq = get_cpu_frequency()
+        memory = get_memory_info()
+        disk = get_disk_info('/')
+        network = get_network_rates()
+        uptime = get_uptime()
+        fan_speed = sensors['fan_speed']
+        power_draw = sensors['power_draw']
+        load = get_load_average()
+
+        # Build response matching frontend expectations
+        metrics = {
+            # CPU metrics
+            'cpuUsage': cpu_usage,
+            'cpuPerCore': get_cpu_usage_per_core(),
+            'cpuTemp': cpu_temp if cpu_temp is not None else 0,
+            'cpuFreq': cpu_freq,
+
+            # Memory metrics
+            'memoryUsage': memory['usage_percent'],
+            'memoryTotal': memory['total_gb'],
+            'memoryUsedGb': memory['used_gb'],
+            'memoryAvailableGb': memory['available_gb'],
+
+            # Disk metrics
+            'diskUsed': disk['usage_percent'] if disk else 0,
+            'diskTotal': disk['total_gb'] if disk else 0,
+            'diskUsedGb': disk['used_gb'] if disk else 0,
+            'diskFreeGb': disk['free_gb'] if disk else 0,
+            'diskDevice': get_disk_device(),
+
+            # Network metrics (MB/s for display)
+            'networkUp': network['upload_mbps'],
+            'networkDown': network['download_mbps'],
+
+            # Network metrics (KB/s for charts)
+            'networkInKbps': network['download_kbps'],
+            'networkOutKbps': network['upload_kbps'],
+
+            # System info
+            'uptime': uptime,
+            'fanSpeed': fan_speed if fan_speed is not None else 0,
+            'powerDraw': power_draw if power_draw is not None else 0,
+
+            # Additional info
+            'networkInterface': get_primary_interface(),
+            'loadAverage': load,
+            'timestamp': time.time(),
+        }
+
+        # Add to history for charts
+        add_to_history({
+            'cpu_usage': cpu_usage,
+            'cpu_temp': metrics['cpuTemp'],
+            'memory_usage': memory['usage_percent'],
+            'network_in_kbps': network['download_kbps'],
+            'network_out_kbps': network['upload_kbps'],
+        })
+
+        return metrics
+
+
+# Start sampling CPU usage in the background
+Thread(target=_cpu_sampler, name='cpu-sampler', daemon=True).start()
@@ -0,0 +1,70 @@
+"""
+Persistent readers for /proc and /sys pseudo-files
+Each file is opened once and re-read from offset 0 on every poll
+"""
+import atexit
+import os
+from threading import Lock
+
+# Files with an open descriptor, closed at interpreter exit
+_open_files = set()
+
+
+class PseudoFile:
+    """
+    A /proc or /sys file kept open between reads
+    The kernel regenerates the contents on each read from offset 0, so a
+    poll costs a single pread() instead of open + read + close
+    """
+
+    def __init__(self, path, size=4096):
+        self.path = path
+        self.size = size  # Read buffer size, grown when the contents don't fit
+        self._fd = None
+        self._open_lock = Lock()
+
+    def read(self):
+        """
+        Read the current contents
+        A read that fills the buffer may have been cut off (e.g. /proc/stat
+        on a many-core host), so it is retried from offset 0 with a buffer
+        twice the size; the larger size is kept for later reads, which stay
+        a single pread() of one consistent snapshot
+        Raises OSError if the file can't be opened or read; the next call
+        then re-opens it (e.g. after a sensor was unplugged)
+        """
+        fd = self._fd
+        if fd is None:
+            fd = self._open()
+        try:
+            while True:
+                data = os.pread(fd, self.size, 0)
+                if len(data) < self.size:
+                    return data
+                self.size *= 2
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        """Close the cached descriptor (a later read() re-opens the file)"""
+        with self._open_lock:
+            fd, self._fd = self._fd, None
+            _open_files.discard(self)
+        if fd is not None:
+            os.close(fd)
+
+    def _open(self):
+        with self._open_lock:
+            if self._fd is None:
+                # O_CLOEXEC (Python's default, made explicit): no leaks into vcgencmd children
+                self._fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK | os.O_CLOEXEC)
+                _open_files.add(self)
+            return self._fd
+
+
+@atexit.register
+def close_all():
+    """Close every descriptor still held by a PseudoFile"""
+    for pseudo_file in list(_open_files):
+        pseudo_file.close()
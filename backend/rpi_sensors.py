@@ -2,12 +2,124 @@
 Raspberry Pi 5 specific sensor readings
 Handles temperature, fan speed, and power estimation
 """
+import bisect
+import fcntl
+import functools
+import logging
 import os
+import re
+import shutil
+import struct
 import subprocess
+import time
 import psutil
-
-# Cache for static system info
-_system_info_cache = None
+from threading import RLock
+from types import MappingProxyType
+
+from logutil import log_rate_limited
+from procfs import PseudoFile
+
+logger = logging.getLogger(__name__)
+
+# Power estimate multiplier by temperature: above _TEMP_BANDS[i] C the factor
+# is _TEMP_POWER_FACTORS[i + 1] (higher temp = more power typically)
+_TEMP_BANDS = (50, 60, 70)
+_TEMP_POWER_FACTORS = (1.0, 1.02, 1.08, 1.15)
+
+# Negative cache: sensor name -> time.monotonic() when it was last found missing
+_missing = {}
+MISSING_SENSOR_TTL = 60  # seconds before probing a missing sensor again
+SLOW_SENSOR_SECONDS = 0.05  # a fan read slower than this counts as slow...
+SLOW_READS_BEFORE_MISSING = 3  # ...and this many in a row mark it missing
+
+# Sensor name -> number of consecutive slow reads
+_slow_reads = {}
+
+# Thermal zone files, kept open between polls
+_THERMAL_FILES = [
+    PseudoFile('/sys/class/thermal/thermal_zone0/temp', size=16),
+    PseudoFile('/sys/devices/virtual/thermal/thermal_zone0/temp', size=16),
+]
+
+# Raspberry Pi 5 fan speed paths (varies by kernel version)
+_FAN_PATHS = [
+    '/sys/devices/platform/cooling_fan/hwmon/hwmon2/fan1_input',
+    '/sys/devices/platform/cooling_fan/hwmon/hwmon3/fan1_input',
+    '/sys/class/hwmon/hwmon2/fan1_input',
+    '/sys/class/hwmon/hwmon3/fan1_input',
+    '/sys/class/hwmon/hwmon1/fan1_input',
+    '/sys/devices/platform/cooling_fan/hwmon/hwmon1/fan1_input',
+]
+
+# Firmware mailbox used for vcgencmd commands (see _VcgencmdSession)
+_VCIO_DEVICE = '/dev/vcio'
+_IOCTL_MBOX_PROPERTY = (3 << 30) | (struct.calcsize('P') << 16) | (100 << 8)  # _IOWR(100, 0, char *)
+_GET_GENCMD_RESULT = 0x00030080
+_GENCMD_MAX_STRING = 1024
+_MBOX_RESPONSE_SUCCESS = 0x80000000
+
+# Looked up once: without the binary a failed mailbox means no vcgencmd at all
+_HAS_VCGENCMD = shutil.which('vcgencmd') is not None
+
+# Fields picked out of /proc/cpuinfo, matched over the whole file at once
+# ([ \t] rather than \s so an empty value can't swallow the next line)
+_CPUINFO_RE = re.compile(rb'^(Serial|Revision|Hardware)[ \t]*:[ \t]*(\S+)', re.M)
+
+# get_throttled bit meanings (current state, and "has occurred since boot")
+_THROTTLE_BITS = (
+    ('under_voltage', 0x1),
+    ('freq_capped', 0x2),
+    ('throttled', 0x4),
+    ('soft_temp_limit', 0x8),
+    ('under_voltage_occurred', 0x10000),
+    ('freq_capped_occurred', 0x20000),
+    ('throttled_occurred', 0x40000),
+    ('soft_temp_limit_occurred', 0x80000),
+)
+
+# Sensor sources that worked last time; probed on first use and
+# reset (re-probed) when a read fails, e.g. after a hot-unplug
+_temp_file = None
+_fan_file = None
+
+# 'sysfs' once a thermal zone has been read; from then on a failed read is
+# retried against the thermal zones only and psutil is never consulted
+_temp_source = None
+
+
+def _read_millidegrees(thermal_file):
+    # The file holds an ASCII integer in millidegrees C; integer division
+    # gives the one decimal we report without float parsing or round()
+    return int(thermal_file.read()) // 100 / 10.0
+
+
+def _read_rpm(fan_file):
+    return int(fan_file.read())
+
+
+def _timed_read(name, parse, sensor_file):
+    """
+    Read a kept-open hwmon file with parse()
+    A wedged hwmon driver can stall reads for seconds, so after
+    SLOW_READS_BEFORE_MISSING reads in a row slower than SLOW_SENSOR_SECONDS
+    the sensor goes in the negative cache; the wall-clock timer also counts
+    GIL and scheduler waits, hence one slow read alone doesn't count
+    """
+    start = time.monotonic()
+    try:
+        return parse(sensor_file)
+    finally:
+        elapsed = time.monotonic() - start
+        if elapsed <= SLOW_SENSOR_SECONDS:
+            _slow_reads.pop(name, None)
+        else:
+            _slow_reads[name] = _slow_reads.get(name, 0) + 1
+            if _slow_reads[name] >= SLOW_READS_BEFORE_MISSING:
+                del _slow_reads[name]
+                _mark_missing(name, True)
+                log_rate_limited(logger, logging.WARNING,
+                                 "Slow reads of %s (last %.0f ms), skipping it for a while",
+                                 sensor_file.path, elapsed * 1000)
 
 
 def get_cpu_temperature():
@@ -15,21 +127,29 @@ def get_cpu_temperature():
     Get CPU temperature from Raspberry Pi thermal zone
     Returns temperature in Celsius or None if unavailable
     """
-    # Try Raspberry Pi thermal zone first
-    thermal_paths = [
-        '/sys/class/thermal/thermal_zone0/temp',
-        '/sys/devices/virtual/thermal/thermal_zone0/temp',
-    ]
+    global _temp_file, _temp_source
 
-    for path in thermal_paths:
+    if _temp_file is not None:
         try:
-            with open(path, 'r') as f:
-                temp = float(f.read().strip()) / 1000.0
-                return round(temp, 1)
-        except (FileNotFoundError, PermissionError, ValueError):
+            return _read_millidegrees(_temp_file)
+        except (OSError, ValueError):
+            _temp_file = None
+
+    # Try Raspberry Pi thermal zone first
+    for thermal_file in _THERMAL_FILES:
+        try:
+            temp = _read_millidegrees(thermal_file)
+        except (OSError, ValueError):
             continue
+        _temp_file = thermal_file
+        _temp_source = 'sysfs'
+        return temp
+
+    # A transient sysfs error; psutil would rescan every hwmon device
+    if _temp_source == 'sysfs':
+        return None
 
-    # Fallback: try psutil sensors_temperatures
+    # Fallback (no thermal zone on this host): try psutil sensors_temperatures
     try:
         temps = psutil.sensors_temperatures()
         if temps:
@@ -42,57 +162,78 @@ def get_cpu_temperature():
                 if entries:
                     return round(entries[0].current, 1)
     except Exception as e:
-        print(f"Error reading temperature via psutil: {e}")
+        log_rate_limited(logger, logging.DEBUG, "Error reading temperature via psutil: %s", e)
 
     return None
 
 
+def _hwmon_fan_paths():
+    """List fan1_input candidates under every /sys/class/hwmon device"""
+    try:
+        with os.scandir('/sys/class/hwmon') as entries:
+            names = sorted(entry.name for entry in entries)
+    except OSError:
+        return []
+
+    # No exists() check: the open in _probe_fan_path fails fast for missing files
+    return [os.path.join('/sys/class/hwmon', name, 'fan1_input') for name in names]
+
+
+def _probe_fan_path():
+    """
+    Find a readable fan sensor: the known paths first, then any hwmon device
+    Returns (PseudoFile, rpm) with the file left open, or (None, None)
+    """
+    for path in _FAN_PATHS + _hwmon_fan_paths():
+        fan_file = PseudoFile(path, size=16)
+        try:
+            return fan_file, _read_rpm(fan_file)
+        except (OSError, ValueError):
+            fan_file.close()
+
+    return None, None
+
+
+def _is_missing(name):
+    """Check if a sensor was found missing less than MISSING_SENSOR_TTL ago"""
+    since = _missing.get(name)
+    return since is not None and time.monotonic() - since < MISSING_SENSOR_TTL
+
+
+def _mark_missing(name, missing):
+    if missing:
+        _missing[name] = time.monotonic()
+    else:
+        _missing.pop(name, None)
+
+
 def get_fan_speed():
     """
     Get fan speed from Raspberry Pi 5 cooling system
     Returns RPM or None if no fan / not readable
     """
-    # Raspberry Pi 5 fan speed paths (varies by kernel version)
-    fan_paths = [
-        '/sys/devices/platform/cooling_fan/hwmon/hwmon2/fan1_input',
-        '/sys/devices/platform/cooling_fan/hwmon/hwmon3/fan1_input',
-        '/sys/class/hwmon/hwmon2/fan1_input',
-        '/sys/class/hwmon/hwmon3/fan1_input',
-        '/sys/class/hwmon/hwmon1/fan1_input',
-        '/sys/devices/platform/cooling_fan/hwmon/hwmon1/fan1_input',
-    ]
-
-    # Try each possible path
-    for path in fan_paths:
-        try:
-            with open(path, 'r') as f:
-                rpm = int(f.read().strip())
-                return rpm
-        except (FileNotFoundError, PermissionError, ValueError):
-            continue
+    global _fan_file
 
-    # Try to find fan dynamically
-    try:
-        hwmon_base = '/sys/class/hwmon'
-        if os.path.exists(hwmon_base):
-            for hwmon in os.listdir(hwmon_base):
-                fan_path = os.path.join(hwmon_base, hwmon, 'fan1_input')
-                if os.path.exists(fan_path):
-                    try:
-                        with open(fan_path, 'r') as f:
-                            rpm = int(f.read().strip())
-                            return rpm
-                    except:
-                        continue
-    except Exception as e:
-        print(f"Error searching for fan sensor: {e}")
+    # Fanless board (or a stalled fan driver): don't touch hwmon on every poll
+    if _is_missing('fan'):
+        return None
 
-    return None
+    if _fan_file is not None:
+        try:
+            return _timed_read('fan', _read_rpm, _fan_file)
+        except (OSError, ValueError):
+            _fan_file.close()
+            _fan_file = None
+
+    _fan_file, rpm = _probe_fan_path()
+    _mark_missing('fan', _fan_file is None)
+    return rpm
 
 
-def get_power_draw():
+def get_power_draw(cpu_percent=None, temp=None):
     """
     Estimate power draw for Raspberry Pi 5
+    Pass cpu_percent / temp when already known to skip re-reading them
 
     Note: Raspberry Pi 5 PMIC doesn't directly expose power readings to userspace
     in a standardized way. This function provides an estimate based on:
@@ -107,129 +248,292 @@ def get_power_draw():
     Returns estimated watts or None
     """
     try:
-        # Get CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        # Get CPU usage (non-blocking, delta since the previous call)
+        if cpu_percent is None:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        if temp is None:
+            temp = get_cpu_temperature()
+        return _estimate_power(cpu_percent, temp)
 
-        # Raspberry Pi 5 power profile (approximate):
-        # - Idle: ~2.5-3W
-        # - Light load: ~4-5W
-        # - Full load: ~8-12W (can spike to 15W with peripherals)
+    except Exception as e:
+        log_rate_limited(logger, logging.DEBUG, "Error estimating power: %s", e)
+        return None
 
-        # Base idle power
-        base_power = 2.7
 
-        # CPU contribution (roughly 0-9W based on load)
-        cpu_power = (cpu_percent / 100.0) * 9.0
+def _estimate_power(cpu_percent, temp):
+    """Power estimate in watts from readings already taken (temp may be None)"""
+    # Raspberry Pi 5 power profile (approximate):
+    # - Idle: ~2.5-3W
+    # - Light load: ~4-5W
+    # - Full load: ~8-12W (can spike to 15W with peripherals)
 
-        # Temperature adjustment (higher temp = more power typically)
-        temp = get_cpu_temperature()
-        temp_factor = 1.0
-        if temp:
-            if temp > 70:
-                temp_factor = 1.15
-            elif temp > 60:
-                temp_factor = 1.08
-            elif temp > 50:
-                temp_factor = 1.02
+    # Base idle power
+    base_power = 2.7
 
-        estimated_power = (base_power + cpu_power) * temp_factor
+    # CPU contribution (roughly 0-9W based on load)
+    cpu_power = (cpu_percent / 100.0) * 9.0
 
-        # Clamp to reasonable range
-        estimated_power = max(2.5, min(15.0, estimated_power))
+    # Temperature adjustment (higher temp = more power typically)
+    temp_factor = _TEMP_POWER_FACTORS[bisect.bisect_left(_TEMP_BANDS, temp)] if temp else 1.0
 
-        return round(estimated_power, 1)
+    estimated_power = (base_power + cpu_power) * temp_factor
+
+    # Clamp to reasonable range
+    estimated_power = max(2.5, min(15.0, estimated_power))
+
+    return round(estimated_power, 1)
+
+
+class _VcgencmdSession:
+    """
+    Runs vcgencmd commands without forking a process per call
+    Talks to the firmware over the /dev/vcio mailbox, which is what the
+    vcgencmd tool itself does; falls back to running the vcgencmd binary if
+    the mailbox can't be used (no device, no permission)
+    """
+
+    def __init__(self):
+        self._fd = None
+        self._use_mailbox = True
+        self._lock = RLock()
+
+    def available(self):
+        """False once neither the mailbox nor the vcgencmd binary can be used"""
+        return self._use_mailbox or (_HAS_VCGENCMD and not _is_missing('vcgencmd'))
+
+    def query(self, command):
+        """Run a command such as 'get_throttled'; returns its output or None"""
+        with self._lock:
+            if self._use_mailbox:
+                try:
+                    return self._mailbox_query(command)
+                except OSError:
+                    self._close()
+                    self._use_mailbox = False
+
+        if not self.available():
+            return None
+        return self._subprocess_query(command)
+
+    def query_many(self, commands):
+        """Run several commands back to back in one session; returns a list of outputs"""
+        with self._lock:
+            if not self.available():
+                return [None] * len(commands)
+            return [self.query(command) for command in commands]
+
+    def _mailbox_query(self, command):
+        if self._fd is None:
+            self._fd = os.open(_VCIO_DEVICE, os.O_RDWR)
+
+        request = command.encode()
+        if len(request) >= _GENCMD_MAX_STRING:
+            return None
+
+        # Property message: size, request code, tag, buffer size, request size,
+        # gencmd error, command/response buffer, end tag
+        buf = bytearray(struct.pack('=6I', 0, 0, _GET_GENCMD_RESULT, _GENCMD_MAX_STRING, 0, 0))
+        buf += request.ljust(_GENCMD_MAX_STRING, b'\0')
+        buf += struct.pack('=I', 0)
+        struct.pack_into('=I', buf, 0, len(buf))
+
+        fcntl.ioctl(self._fd, _IOCTL_MBOX_PROPERTY, buf, True)
+
+        if struct.unpack_from('=I', buf, 4)[0] != _MBOX_RESPONSE_SUCCESS:
+            raise OSError('vcio mailbox request failed')
+        if struct.unpack_from('=I', buf, 20)[0] != 0:
+            return None  # Firmware rejected the command
+
+        return buf[24:24 + _GENCMD_MAX_STRING].split(b'\0', 1)[0].decode().strip()
+
+    def _subprocess_query(self, command):
+        try:
+            result = subprocess.run(
+                ['vcgencmd'] + command.split(),
+                capture_output=True,
+                text=True,
+                timeout=2
+            )
+            if result.returncode == 0:
+                return result.stdout.strip()
+        except FileNotFoundError:
+            _mark_missing('vcgencmd', True)  # Not a Pi (or utils not installed)
+        except (subprocess.TimeoutExpired, PermissionError):
+            pass
 
-    except Exception as e:
-        print(f"Error estimating power: {e}")
         return None
 
+    def _close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+_vcgencmd = _VcgencmdSession()
+
 
 def try_vcgencmd_power():
     """
     Try to get power info from vcgencmd (Raspberry Pi specific)
     This is experimental and may not work on all systems
     """
-    try:
-        # Try to read PMIC ADC values
-        result = subprocess.run(
-            ['vcgencmd', 'pmic_read_adc'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
-        pass
+    # Not a Pi, or older firmware without pmic_read_adc; don't keep asking
+    if not _vcgencmd.available() or _is_missing('pmic_adc'):
+        return None
+
+    # Try to read PMIC ADC values
+    output = _vcgencmd.query('pmic_read_adc')
+    _mark_missing('pmic_adc', output is None)
+    return output
+
+
+def throttle_status_int():
+    """
+    Get the raw get_throttled bitfield from the firmware
+    Returns an int (test bits with the masks in _THROTTLE_BITS) or None
+    """
+    return _parse_throttled(_vcgencmd.query('get_throttled'))
+
+
+def _parse_throttled(output):
+    # Parse throttled=0x0 format
+    if output and '=' in output:
+        try:
+            return int(output.split('=')[1], 16)
+        except ValueError:
+            pass
 
     return None
 
 
+def _throttle_flags(val):
+    if val is None:
+        return None
+
+    status = {name: bool(val & mask) for name, mask in _THROTTLE_BITS}
+    status['raw'] = hex(val)
+    return status
+
+
 def get_throttle_status():
     """
     Get throttling status from Raspberry Pi
     Returns dictionary with throttle flags
     """
-    try:
-        result = subprocess.run(
-            ['vcgencmd', 'get_throttled'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            # Parse throttled=0x0 format
-            output = result.stdout.strip()
-            if '=' in output:
-                hex_val = output.split('=')[1]
-                val = int(hex_val, 16)
-                return {
-                    'raw': hex_val,
-                    'under_voltage': bool(val & 0x1),
-                    'freq_capped': bool(val & 0x2),
-                    'throttled': bool(val & 0x4),
-                    'soft_temp_limit': bool(val & 0x8),
-                    'under_voltage_occurred': bool(val & 0x10000),
-                    'freq_capped_occurred': bool(val & 0x20000),
-                    'throttled_occurred': bool(val & 0x40000),
-                    'soft_temp_limit_occurred': bool(val & 0x80000),
-                }
-    except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
-        pass
+    return _throttle_flags(throttle_status_int())
+
+
+def _parse_gpu_memory(output):
+    # Parse gpu=76M format
+    if output and '=' in output:
+        try:
+            return int(output.split('=')[1].rstrip('M'))
+        except ValueError:
+            pass
 
     return None
 
 
 def get_gpu_memory():
     """Get GPU memory allocation on Raspberry Pi"""
-    try:
-        result = subprocess.run(
-            ['vcgencmd', 'get_mem', 'gpu'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.returncode == 0:
-            # Parse gpu=76M format
-            output = result.stdout.strip()
-            if '=' in output:
-                mem_str = output.split('=')[1].rstrip('M')
-                return int(mem_str)
-    except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError, ValueError):
-        pass
+    return _parse_gpu_memory(_vcgencmd.query('get_mem gpu'))
+
+
+def get_all_vcgencmd():
+    """
+    Get throttle status, GPU memory and PMIC ADC readings in one vcgencmd
+    session instead of three separate calls
+    """
+    if not _vcgencmd.available():
+        return {'throttle_status': None, 'gpu_memory': None, 'pmic_adc': None}
+
+    probe_pmic = not _is_missing('pmic_adc')
+    commands = ['get_throttled', 'get_mem gpu'] + (['pmic_read_adc'] if probe_pmic else [])
+    throttled, gpu_mem, pmic_adc = (_vcgencmd.query_many(commands) + [None])[:3]
+    if probe_pmic:
+        _mark_missing('pmic_adc', pmic_adc is None)
+
+    return {
+        'throttle_status': _throttle_flags(_parse_throttled(throttled)),
+        'gpu_memory': _parse_gpu_memory(gpu_mem),
+        'pmic_adc': pmic_adc,
+    }
+
+
+def get_all_sensors(cpu_percent=None, vcgencmd=True):
+    """
+    Read every sensor in one pass: temperature and fan once each, the
+    vcgencmd values in one session, and the power estimate derived from
+    the temperature just read instead of reading it again
+    Pass cpu_percent when already known; vcgencmd=False leaves out
+    throttle_status / gpu_memory / pmic_adc (e.g. when polled less often)
+    """
+    if cpu_percent is None:
+        cpu_percent = psutil.cpu_percent(interval=None)
+
+    cpu_temp = get_cpu_temperature()
+    sensors = {
+        'cpu_temp': cpu_temp,
+        'fan_speed': get_fan_speed(),
+        # Never re-reads the temperature, even when it is unavailable (None)
+        'power_draw': _estimate_power(cpu_percent, cpu_temp),
+    }
+    if vcgencmd:
+        sensors.update(get_all_vcgencmd())
+
+    return sensors
+
+
+@functools.lru_cache(maxsize=1)
+def _read_device_tree_model():
+    """
+    Read the board model string from the device tree (static for the boot)
+    Returns e.g. 'Raspberry Pi 5 Model B Rev 1.0', or None without a device tree
+    """
+    for path in ('/proc/device-tree/model', '/sys/firmware/devicetree/base/model'):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                raw = os.read(fd, 128)
+            finally:
+                os.close(fd)
+        except OSError:
+            continue
+        return raw.rstrip(b'\x00').decode(errors='replace').strip()
 
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _read_cpuinfo_once():
+    """
+    Read /proc/cpuinfo in a single pass (it is static for the boot)
+    Returns the Serial/Revision/Hardware fields found plus '_raw_lower',
+    the whole file lowercased for substring checks
+    """
+    try:
+        with open('/proc/cpuinfo', 'rb') as f:
+            content = f.read()
+    except OSError:
+        return {'_raw_lower': ''}
+
+    info = {key.decode(): value.decode() for key, value in _CPUINFO_RE.findall(content)}
+    info['_raw_lower'] = content.decode(errors='replace').lower()
+    return info
+
+
 def get_system_info():
     """
     Get static system information (cached after first call)
+    Returns a read-only mapping; copy it with dict() to modify
     """
-    global _system_info_cache
+    return _compute_system_info()
 
-    if _system_info_cache is not None:
-        return _system_info_cache
 
+# lru_cache doesn't serialize misses: concurrent first calls may each build
+# the info. Harmless, it's idempotent and every later call gets the cached one
+@functools.lru_cache(maxsize=1)
+def _compute_system_info():
     info = {
         'model': 'Unknown',
         'serial': 'Unknown',
@@ -239,45 +543,28 @@ def get_system_info():
     }
 
     # Try to get Raspberry Pi model
-    try:
-        with open('/proc/device-tree/model', 'r') as f:
-            info['model'] = f.read().strip().rstrip('\x00')
-    except:
-        try:
-            with open('/sys/firmware/devicetree/base/model', 'r') as f:
-                info['model'] = f.read().strip().rstrip('\x00')
-        except:
-            pass
+    info['model'] = _read_device_tree_model() or info['model']
 
     # Try to get serial number
-    try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line.startswith('Serial'):
-                    info['serial'] = line.split(':')[1].strip()
-                elif line.startswith('Revision'):
-                    info['revision'] = line.split(':')[1].strip()
-    except:
-        pass
-
-    _system_info_cache = info
-    return info
+    cpuinfo = _read_cpuinfo_once()
+    info['serial'] = cpuinfo.get('Serial', info['serial'])
+    info['revision'] = cpuinfo.get('Revision', info['revision'])
+
+    return MappingProxyType(info)
 
 
+@functools.lru_cache(maxsize=1)
 def is_raspberry_pi():
-    """Check if running on a Raspberry Pi"""
-    try:
-        with open('/proc/device-tree/model', 'r') as f:
-            model = f.read().lower()
-            return 'raspberry' in model
-    except:
-        pass
+    """Check if running on a Raspberry Pi (cached, the answer can't change)"""
+    # The device-tree model is a few bytes and always present on a Pi
+    model = _read_device_tree_model()
+    if model is not None:
+        return 'raspberry' in model.lower()
+
+    # No device tree (not ARM), fall back to cpuinfo
+    content = _read_cpuinfo_once()['_raw_lower']
+    return 'raspberry' in content or 'bcm' in content
 
-    try:
-        with open('/proc/cpuinfo', 'r') as f:
-            content = f.read().lower()
-            return 'raspberry' in content or 'bcm' in content
-    except:
-        pass
 
-    return False
+# Prime psutil's CPU counters so the first non-blocking cpu_percent() call is meaningful
+psutil.cpu_percent(interval=None)
@@ -0,0 +1,51 @@
+"""
+Conditional request checks for the cached metrics endpoints
+
+Run from the backend directory: python -m unittest test_app
+"""
+import time
+import unittest
+
+import app as monitor
+
+
+class ETagTest(unittest.TestCase):
+    """If-None-Match handling for the collector-backed endpoints"""
+
+    @classmethod
+    def setUpClass(cls):
+        # Park the collector so the tick can't move between the two requests
+        monitor.collector.set_poll_interval(3600)
+        time.sleep(0.5)
+        cls.client = monitor.app.test_client()
+
+    def assert_revalidates(self, url, encoding):
+        headers = {'Accept-Encoding': encoding}
+        first = self.client.get(url, headers=headers)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.headers.get('Content-Encoding'), encoding)
+        etag = first.headers['ETag']
+        self.assertTrue(etag.endswith(f':{encoding}"'), etag)
+
+        second = self.client.get(url, headers={**headers, 'If-None-Match': etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.data, b'')
+
+    def test_metrics(self):
+        for encoding in ('gzip', 'br'):
+            with self.subTest(encoding=encoding):
+                self.assert_revalidates('/api/metrics', encoding)
+
+    def test_metrics_live(self):
+        for encoding in ('gzip', 'br'):
+            with self.subTest(encoding=encoding):
+                self.assert_revalidates('/api/metrics/live', encoding)
+
+    def test_tag_from_previous_process(self):
+        # A bare tick, as cached by a browser before a restart
+        response = self.client.get('/api/metrics/static', headers={'If-None-Match': 'W/"1"'})
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
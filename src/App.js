@@ -40,6 +40,7 @@ const API_BASE_URL = process.env.REACT_APP_API_URL || '';
 // --- Monitoring Configuration ---
 // Adjust these values to change refresh rate and chart history
 const UPDATE_INTERVAL_MS = 1000;  // How often to fetch data (1000ms = 1 second)
+const STATIC_UPDATE_INTERVAL_MS = 60000;  // How often to refresh rarely-changing info (totals, device names)
 const CHART_HISTORY_MINUTES = 60;  // How many minutes of history to show (5 min = 300 points at 1s)
 const CHART_MAX_POINTS = (CHART_HISTORY_MINUTES * 60 * 1000) / UPDATE_INTERVAL_MS;
 
@@ -88,27 +89,25 @@ export default function App() {
   useEffect(() => {
     const fetchMetrics = async () => {
       try {
-        const response = await fetch(`${API_BASE_URL}/api/metrics`);
+        const response = await fetch(`${API_BASE_URL}/api/metrics/live`);
         if (!response.ok) throw new Error('Failed to fetch metrics');
         const data = await response.json();
 
-        setMetrics({
+        // Merge over the static fields fetched by fetchStaticMetrics
+        setMetrics(prev => ({
+          ...prev,
           cpuUsage: data.cpuUsage || 0,
           cpuTemp: data.cpuTemp || 0,
           memoryUsage: data.memoryUsage || 0,
-          memoryTotal: data.memoryTotal || 8,
           uptime: data.uptime || 'Unknown',
           diskUsed: data.diskUsed || 0,
-          diskTotal: data.diskTotal || 0,
           diskUsedGb: data.diskUsedGb || 0,
           diskFreeGb: data.diskFreeGb || 0,
           fanSpeed: data.fanSpeed || 0,
           powerDraw: data.powerDraw || 0,
           networkUp: data.networkUp || 0,
           networkDown: data.networkDown || 0,
-          networkInterface: data.networkInterface || 'eth0',
-          diskDevice: data.diskDevice || '/dev/root',
-        });
+        }));
 
         // Update history for charts
         const newDataPoint = {
@@ -129,6 +128,24 @@ export default function App() {
       }
     };
 
+    const fetchStaticMetrics = async () => {
+      try {
+        const response = await fetch(`${API_BASE_URL}/api/metrics/static`);
+        if (!response.ok) throw new Error('Failed to fetch static metrics');
+        const data = await response.json();
+
+        setMetrics(prev => ({
+          ...prev,
+          memoryTotal: data.memoryTotal || 8,
+          diskTotal: data.diskTotal || 0,
+          networkInterface: data.networkInterface || 'eth0',
+          diskDevice: data.diskDevice || '/dev/root',
+        }));
+      } catch (err) {
+        console.error('Failed to fetch static metrics:', err);
+      }
+    };
+
     const fetchProcesses = async () => {
       try {
         const response = await fetch(`${API_BASE_URL}/api/processes?limit=5`);
@@ -141,14 +158,17 @@ export default function App() {
     };
 
     // Initial fetch
+    fetchStaticMetrics();
     fetchMetrics();
     fetchProcesses();
 
     // Poll at configured interval
+    const staticInterval = setInterval(fetchStaticMetrics, STATIC_UPDATE_INTERVAL_MS);
     const metricsInterval = setInterval(fetchMetrics, UPDATE_INTERVAL_MS);
     const processesInterval = setInterval(fetchProcesses, UPDATE_INTERVAL_MS * 5);
 
     return () => {
+      clearInterval(staticInterval);
       clearInterval(metricsInterval);
       clearInterval(processesInterval);
     };
@@ -231,7 +251,7 @@ export default function App() {
         <StatCard
           title="Memory"
           value={`${(metrics.memoryUsage / 100 * metrics.memoryTotal).toFixed(1)} GB`}
-          subtext={`${metrics.memoryUsage.toFixed(1)}% of ${metrics.memoryTotal}GB`}
+          subtext={`${metrics.memoryUsage.toFixed(1)}% of ${metrics.memoryTotal.toFixed(2)}GB`}
           icon={MemoryStick}
           color={COLORS.accentBlue}
         />
@@ -343,15 +363,15 @@ export default function App() {
              <div className="mt-6 space-y-3">
                 <div className="flex justify-between text-sm">
                     <span className="text-slate-400">Used</span>
-                    <span className="text-emerald-400 font-medium">{metrics.diskUsedGb} GB</span>
+                    <span className="text-emerald-400 font-medium">{metrics.diskUsedGb.toFixed(1)} GB</span>
                 </div>
                 <div className="flex justify-between text-sm">
                     <span className="text-slate-400">Free</span>
-                    <span className="text-slate-200 font-medium">{metrics.diskFreeGb} GB</span>
+                    <span className="text-slate-200 font-medium">{metrics.diskFreeGb.toFixed(1)} GB</span>
                 </div>
                 <div className="flex justify-between text-sm border-t border-slate-800 pt-2">
                     <span className="text-slate-400">Total</span>
-                    <span className="text-slate-200 font-medium">{metrics.diskTotal} GB</span>
+                    <span className="text-slate-200 font-medium">{metrics.diskTotal.toFixed(1)} GB</span>
                 </div>
              </div>
           </div>